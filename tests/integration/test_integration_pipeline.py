@@ -6,17 +6,118 @@ golden master/snapshot testing approach.
 Each configN.yaml has a corresponding configN-output/ golden master.
 To regenerate golden master:
     publishmd -c tests/integration/config1.yaml -i tests/integration/example -o tests/integration/config1-output
+or rewrite every mismatching golden master from the test run itself:
+    PUBLISHMD_UPDATE_GOLDEN=1 pytest tests/integration
 """
 
+import hashlib
+import os
 import pytest
 import shutil
 import filecmp
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import List, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from publishmd.processor import Processor
 
+_GOLDEN_HASHES_KEY = "publishmd/golden_hashes"
+
+_TEXT_EXTENSIONS = frozenset(
+    {
+        ".qmd",
+        ".md",
+        ".txt",
+        ".yaml",
+        ".yml",
+        ".json",
+        ".html",
+        ".css",
+        ".js",
+    }
+)
+
+
+def _get_config_scenarios(integration_dir: Path) -> List[Tuple[Path, Path]]:
+    """Get all config scenarios (config file, expected output dir)."""
+    scenarios = []
+    for config_file in sorted(integration_dir.glob("config*.yaml")):
+        config_name = config_file.stem  # e.g., "config1"
+        expected_output_dir = integration_dir / f"{config_name}-output"
+        if expected_output_dir.exists():
+            scenarios.append((config_file, expected_output_dir))
+    return scenarios
+
+
+_SCENARIOS = _get_config_scenarios(Path(__file__).parent)
+# Fail at collection rather than letting an empty parameter set skip silently
+assert len(_SCENARIOS) > 0, "No config scenarios found"
+
+
+def _read_file(file_path: Path) -> bytes:
+    """Read a whole file with unbuffered reads sized from fstat."""
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        data = os.read(fd, os.fstat(fd).st_size)
+        # A single read may come up short (Linux caps it at 0x7ffff000 bytes)
+        chunks = [data]
+        while chunk := os.read(fd, max(len(data), 1 << 16)):
+            chunks.append(chunk)
+        return data if len(chunks) == 1 else b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _tree_snapshot(directory: Path) -> Dict[str, Tuple[int, int]]:
+    """Map every file under directory to its (mtime_ns, size)."""
+    snapshot = {}
+    for root, _, filenames in os.walk(directory):
+        for filename in filenames:
+            file_path = os.path.join(root, filename)
+            stat = os.stat(file_path)
+            snapshot[file_path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def _file_digest(file_path: Path) -> str:
+    """Hash a file's bytes with BLAKE2b."""
+    return hashlib.blake2b(_read_file(file_path), digest_size=16).hexdigest()
+
+
+def _read_text(file_path: Path) -> str:
+    """Read a UTF-8 file with universal newlines, like Path.read_text."""
+    content = _read_file(file_path).decode("utf-8")
+    if "\r" not in content:
+        return content
+    return content.replace("\r\n", "\n").replace("\r", "\n")
+
+
+class _GoldenHashes:
+    """Golden master digests from a previous run, keeping only those used again."""
+
+    def __init__(self, cached: Dict[str, Dict[str, Any]]):
+        self._cached = cached
+        self.used: Dict[str, Dict[str, Any]] = {}
+
+    def digest(self, expected_file: Path) -> str:
+        """Get the digest of a golden file, reusing it while the file is unchanged."""
+        stat = expected_file.stat()
+        key = str(expected_file)
+        entry = self._cached.get(key)
+        if not (
+            entry
+            and entry["mtime_ns"] == stat.st_mtime_ns
+            and entry["size"] == stat.st_size
+        ):
+            entry = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "hash": _file_digest(expected_file),
+            }
+        self.used[key] = entry
+        return entry["hash"]
+
 
 @pytest.mark.integration
 class TestIntegrationPipeline:
@@ -32,65 +133,65 @@ class TestIntegrationPipeline:
         """Get path to example content."""
         return integration_dir / "example"
 
-    def get_config_scenarios(self, integration_dir: Path) -> List[Tuple[str, str]]:
-        """Get all config scenarios (config file, expected output dir)."""
-        scenarios = []
-        for config_file in integration_dir.glob("config*.yaml"):
-            config_name = config_file.stem  # e.g., "config1"
-            expected_output_dir = integration_dir / f"{config_name}-output"
-            if expected_output_dir.exists():
-                scenarios.append((str(config_file), str(expected_output_dir)))
-        return scenarios
-
-    def test_all_config_scenarios(self, integration_dir: Path, example_dir: Path):
-        """Test all available config scenarios."""
-        scenarios = self.get_config_scenarios(integration_dir)
-        assert len(scenarios) > 0, "No config scenarios found"
-
-        for config_file_str, expected_output_dir_str in scenarios:
-            config_file = Path(config_file_str)
-            expected_output_dir = Path(expected_output_dir_str)
-
-            with TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Copy input content to temporary location
-                input_dir = temp_path / "input"
-                shutil.copytree(example_dir, input_dir)
-
-                # Set up actual output directory
-                actual_output_dir = temp_path / "actual_output"
-
-                # Run processor with specific config
-                processor = Processor(str(config_file))
-                processor.process(input_dir, actual_output_dir)
-
-                # Compare directory structures recursively
-                self._assert_directories_equal(
-                    actual_output_dir, expected_output_dir, config_name=config_file.stem
-                )
-        """Test that each config scenario produces expected output."""
-        with TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Copy input content to temporary location
-            input_dir = temp_path / "input"
-            shutil.copytree(example_dir, input_dir)
-
-            # Set up actual output directory
-            actual_output_dir = temp_path / "actual_output"
-
-            # Run processor with specific config
-            processor = Processor(str(config_file))
-            processor.process(input_dir, actual_output_dir)
-
-            # Compare directory structures recursively
+    @pytest.fixture
+    def input_dir(self, example_dir: Path) -> Iterator[Path]:
+        """Process example content in place, checking that it is left untouched."""
+        snapshot = _tree_snapshot(example_dir)
+        yield example_dir
+        assert (
+            _tree_snapshot(example_dir) == snapshot
+        ), f"Processing modified input directory {example_dir}"
+
+    @pytest.mark.parametrize(
+        "config_file,expected_output_dir",
+        _SCENARIOS,
+        ids=[config_file.stem for config_file, _ in _SCENARIOS],
+    )
+    def test_config_scenario(
+        self,
+        config_file: Path,
+        expected_output_dir: Path,
+        input_dir: Path,
+        pytestconfig: pytest.Config,
+        tmp_path: Path,
+    ):
+        """Test that a config scenario produces its golden master output."""
+        # Golden master digests persist across runs in pytest's cache, under one
+        # key per scenario so parallel workers do not clobber each other
+        cache = getattr(pytestconfig, "cache", None)
+        cache_key = f"{_GOLDEN_HASHES_KEY}/{config_file.stem}"
+        golden_hashes = _GoldenHashes(cache.get(cache_key, {})) if cache else None
+
+        # Set up actual output directory
+        actual_output_dir = tmp_path / "actual_output"
+
+        # Run processor with specific config
+        processor = Processor(str(config_file))
+        processor.process(input_dir, actual_output_dir)
+
+        # Compare directory structures recursively
+        try:
             self._assert_directories_equal(
-                actual_output_dir, expected_output_dir, config_name=config_file.stem
+                actual_output_dir,
+                expected_output_dir,
+                config_name=config_file.stem,
+                golden_hashes=golden_hashes,
             )
+        except AssertionError:
+            if os.environ.get("PUBLISHMD_UPDATE_GOLDEN") != "1":
+                raise
+            shutil.rmtree(expected_output_dir)
+            shutil.copytree(actual_output_dir, expected_output_dir)
+        finally:
+            if cache:
+                cache.set(cache_key, golden_hashes.used)
 
     def _assert_directories_equal(
-        self, actual_dir: Path, expected_dir: Path, config_name: str = "unknown"
+        self,
+        actual_dir: Path,
+        expected_dir: Path,
+        config_name: str = "unknown",
+        golden_hashes: Optional["_GoldenHashes"] = None,
     ):
         """
         Recursively compare two directory trees for exact equality.
@@ -99,6 +200,7 @@ class TestIntegrationPipeline:
             actual_dir: Directory with actual output
             expected_dir: Directory with expected output (golden master)
             config_name: Name of config for better error messages
+            golden_hashes: Optional cache of golden master digests
         """
         # Check that both directories exist
         assert (
@@ -108,36 +210,128 @@ class TestIntegrationPipeline:
             expected_dir.exists()
         ), f"Expected output directory {expected_dir} does not exist (config: {config_name})"
 
-        # Get all files in both directories
-        actual_files = self._get_all_relative_files(actual_dir)
-        expected_files = self._get_all_relative_files(expected_dir)
+        # Match up files in both directories
+        common_files, actual_only, expected_only = self._diff_trees(
+            actual_dir, expected_dir
+        )
 
         # Check that the same files exist
-        assert actual_files == expected_files, (
+        assert not actual_only and not expected_only, (
             f"File lists differ for {config_name}.\n"
-            f"Actual files: {sorted(actual_files)}\n"
-            f"Expected files: {sorted(expected_files)}\n"
-            f"Missing from actual: {sorted(expected_files - actual_files)}\n"
-            f"Extra in actual: {sorted(actual_files - expected_files)}"
+            f"Actual files: {sorted(common_files + actual_only)}\n"
+            f"Expected files: {sorted(common_files + expected_only)}\n"
+            f"Missing from actual: {sorted(expected_only)}\n"
+            f"Extra in actual: {sorted(actual_only)}"
         )
 
-        # Compare each file content
-        for relative_path in sorted(actual_files):
-            actual_file = actual_dir / relative_path
-            expected_file = expected_dir / relative_path
+        # Compare each file content; comparisons are I/O-bound, so overlap them
+        def compare(relative_name: str) -> Optional[AssertionError]:
+            relative_path = Path(relative_name)
+            try:
+                self._assert_files_equal(
+                    actual_dir / relative_path,
+                    expected_dir / relative_path,
+                    relative_path,
+                    config_name,
+                    golden_hashes,
+                )
+            except AssertionError as error:
+                return error
+            return None
+
+        # Sort in place so failures are reported in a stable order; the
+        # listings in the message above are only built when it fails
+        common_files.sort()
+        if not common_files:
+            return
+        with ThreadPoolExecutor(max_workers=min(32, len(common_files))) as executor:
+            failures = [
+                error
+                for error in executor.map(compare, common_files)
+                if error is not None
+            ]
+
+        # Report every mismatching file, not just the first
+        if failures:
+            raise AssertionError("\n\n".join(map(str, failures)))
+
+    def _diff_trees(
+        self, actual_dir: Path, expected_dir: Path
+    ) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Match up two directory trees by name.
 
-            self._assert_files_equal(
-                actual_file, expected_file, relative_path, config_name
-            )
+        Returns:
+            Relative POSIX-style paths of files present in both trees, and of
+            files present only in the actual or only in the expected tree
+        """
+        common_files, actual_only, expected_only = [], [], []
+        for relative_name, in_actual, in_expected in self._walk_pair(
+            actual_dir, expected_dir
+        ):
+            if in_actual and in_expected:
+                common_files.append(relative_name)
+            elif in_actual:
+                actual_only.append(relative_name)
+            else:
+                expected_only.append(relative_name)
+        return common_files, actual_only, expected_only
+
+    def _walk_pair(
+        self,
+        actual_dir: Union[str, os.PathLike],
+        expected_dir: Union[str, os.PathLike],
+        prefix: str = "",
+    ) -> Iterator[Tuple[str, bool, bool]]:
+        """
+        Walk two directory trees together, joining files by name.
 
-    def _get_all_relative_files(self, directory: Path) -> set:
-        """Get all files in directory as relative paths."""
-        files = set()
-        for item in directory.rglob("*"):
-            if item.is_file():
-                relative_path = item.relative_to(directory)
-                files.add(relative_path)
-        return files
+        Yields:
+            (relative path, in actual tree, in expected tree) for every file
+            in either tree; directories are only descended into
+        """
+        with os.scandir(actual_dir) as entries:
+            actual_entries = {entry.name: entry for entry in entries}
+        with os.scandir(expected_dir) as entries:
+            expected_entries = {entry.name: entry for entry in entries}
+
+        for name in sorted(actual_entries.keys() | expected_entries.keys()):
+            actual_entry = actual_entries.get(name)
+            expected_entry = expected_entries.get(name)
+            relative_name = prefix + name
+            actual_is_dir = actual_entry is not None and actual_entry.is_dir()
+            expected_is_dir = expected_entry is not None and expected_entry.is_dir()
+
+            if actual_is_dir and expected_is_dir:
+                yield from self._walk_pair(
+                    actual_entry.path, expected_entry.path, f"{relative_name}/"
+                )
+                continue
+
+            # A directory present on one side only contributes its files
+            if actual_is_dir:
+                for file_name in self._walk_files(actual_entry.path, relative_name):
+                    yield file_name, True, False
+            if expected_is_dir:
+                for file_name in self._walk_files(expected_entry.path, relative_name):
+                    yield file_name, False, True
+
+            in_actual = actual_entry is not None and actual_entry.is_file()
+            in_expected = expected_entry is not None and expected_entry.is_file()
+            if in_actual or in_expected:
+                yield relative_name, in_actual, in_expected
+
+    def _walk_files(
+        self, directory: Union[str, os.PathLike], prefix: str
+    ) -> Iterator[str]:
+        """Yield relative POSIX-style paths of all files under directory."""
+        with os.scandir(directory) as entries:
+            for entry in sorted(entries, key=lambda entry: entry.name):
+                relative_name = f"{prefix}/{entry.name}"
+                if entry.is_dir():
+                    yield from self._walk_files(entry.path, relative_name)
+                elif entry.is_file():
+                    yield relative_name
 
     def _assert_files_equal(
         self,
@@ -145,6 +339,7 @@ class TestIntegrationPipeline:
         expected_file: Path,
         relative_path: Path,
         config_name: str,
+        golden_hashes: Optional["_GoldenHashes"] = None,
     ):
         """Compare two files for exact equality with helpful error messages."""
         # Check that both files exist
@@ -155,54 +350,40 @@ class TestIntegrationPipeline:
             expected_file.exists()
         ), f"Expected file {relative_path} does not exist (config: {config_name})"
 
-        # For text files, compare content with detailed diff
+        # Files of different size can never match, so only compare bytes when
+        # sizes agree. Byte-identical files need no decoding; only build a diff
+        # on mismatch
+        actual_size = actual_file.stat().st_size
+        expected_size = expected_file.stat().st_size
+        if actual_size == expected_size:
+            if golden_hashes is not None:
+                # Compare against the cached golden digest to skip reading it
+                if golden_hashes.digest(expected_file) == _file_digest(actual_file):
+                    return
+            elif filecmp.cmp(actual_file, expected_file, shallow=False):
+                return
+
+        # For text files, compare decoded content
         if self._is_text_file(actual_file):
-            actual_content = actual_file.read_text(encoding="utf-8")
-            expected_content = expected_file.read_text(encoding="utf-8")
-
-            if actual_content != expected_content:
-                # Create detailed diff for debugging
-                import difflib
-
-                diff = "\n".join(
-                    difflib.unified_diff(
-                        expected_content.splitlines(keepends=True),
-                        actual_content.splitlines(keepends=True),
-                        fromfile=f"expected/{relative_path}",
-                        tofile=f"actual/{relative_path}",
-                        lineterm="",
-                    )
-                )
+            actual_content = _read_text(actual_file)
+            expected_content = _read_text(expected_file)
 
-                assert False, (
-                    f"File content differs: {relative_path} (config: {config_name})\n"
-                    f"Diff:\n{diff}"
-                )
+            # Pytest's assertion rewriting renders the diff only on failure
+            assert (
+                actual_content == expected_content
+            ), f"File content differs: {relative_path} (config: {config_name})"
         else:
-            # For binary files, compare bytes
-            actual_content = actual_file.read_bytes()
-            expected_content = expected_file.read_bytes()
-
-            assert actual_content == expected_content, (
+            # Binary files are already known to differ here
+            assert False, (
                 f"Binary file content differs: {relative_path} (config: {config_name})\n"
-                f"Actual size: {len(actual_content)} bytes\n"
-                f"Expected size: {len(expected_content)} bytes"
+                f"Actual size: {actual_size} bytes\n"
+                f"Expected size: {expected_size} bytes"
             )
 
     def _is_text_file(self, file_path: Path) -> bool:
         """Check if file is likely a text file."""
-        text_extensions = {
-            ".qmd",
-            ".md",
-            ".txt",
-            ".yaml",
-            ".yml",
-            ".json",
-            ".html",
-            ".css",
-            ".js",
-        }
-        return file_path.suffix.lower() in text_extensions
+        suffix = file_path.suffix
+        return (suffix if suffix.islower() else suffix.lower()) in _TEXT_EXTENSIONS
 
 
 @pytest.mark.integration